@@ -1,4 +1,14 @@
 from pathlib import Path
 
+import jax
+
 # package root
 ROOT = str(Path(__file__).parent.absolute())
+
+# Use a persistent compilation cache, so that jitting the (expensive) controller
+# optimization steps is only slow the first time we run a given task. This
+# respects any cache directory the user has already configured.
+if jax.config.jax_compilation_cache_dir is None:
+    jax.config.update(
+        "jax_compilation_cache_dir", str(Path.home() / ".cache" / "hydrax_jax")
+    )
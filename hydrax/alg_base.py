@@ -178,6 +178,10 @@ class SamplingBasedController(ABC):
 
             return x, (x, cost, sites)
 
+        # N.B. neither the scan over the horizon nor the inner fori_loop over
+        # sim steps is unrolled, so mjx.step is only traced and compiled once.
+        # This keeps jit times independent of the planning horizon, at the cost
+        # of some loop overhead that unrolling (e.g., unroll=2) could remove.
         final_state, (states, costs, trace_sites) = jax.lax.scan(
             _scan_fn, state, controls
         )
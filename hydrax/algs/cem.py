@@ -84,9 +84,8 @@ class CEM(SamplingBasedController):
         """Update the mean with an exponentially weighted average."""
         costs = jnp.sum(rollouts.costs, axis=1)  # sum over time steps
 
-        # Sort the costs and get the indices of the elites.
-        indices = jnp.argsort(costs)
-        elites = indices[: self.num_elites]
+        # Get the indices of the elites, without fully sorting the costs.
+        _, elites = jax.lax.top_k(-costs, self.num_elites)
 
         # The new proposal distribution is a Gaussian fit to the elites.
         mean = jnp.mean(rollouts.controls[elites], axis=0)
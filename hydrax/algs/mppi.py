@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import jax
 import jax.numpy as jnp
@@ -40,6 +40,7 @@ class MPPI(SamplingBasedController):
         num_randomizations: int = 1,
         risk_strategy: RiskStrategy = None,
         seed: int = 0,
+        num_elites: Optional[int] = None,
     ):
         """Initialize the controller.
 
@@ -53,11 +54,16 @@ class MPPI(SamplingBasedController):
             risk_strategy: How to combining costs from different randomizations.
                            Defaults to average cost.
             seed: The random seed for domain randomization.
+            num_elites: If set, only average over this many of the
+                        lowest-cost samples (as in iCEM). Defaults to None,
+                        which averages over all of the samples.
         """
+        assert num_elites is None or 0 < num_elites <= num_samples
         super().__init__(task, num_randomizations, risk_strategy, seed)
         self.noise_level = noise_level
         self.num_samples = num_samples
         self.temperature = temperature
+        self.num_elites = num_elites
 
     def init_params(self, seed: int = 0) -> MPPIParams:
         """Initialize the policy parameters."""
@@ -86,9 +92,16 @@ class MPPI(SamplingBasedController):
     ) -> MPPIParams:
         """Update the mean with an exponentially weighted average."""
         costs = jnp.sum(rollouts.costs, axis=1)  # sum over time steps
+        controls = rollouts.controls
+
+        if self.num_elites is not None:
+            # Only keep the lowest-cost samples
+            _, elites = jax.lax.top_k(-costs, self.num_elites)
+            costs, controls = costs[elites], controls[elites]
+
         # N.B. jax.nn.softmax takes care of details like baseline subtraction.
         weights = jax.nn.softmax(-costs / self.temperature, axis=0)
-        mean = jnp.sum(weights[:, None, None] * rollouts.controls, axis=0)
+        mean = jnp.sum(weights[:, None, None] * controls, axis=0)
         return params.replace(mean=mean)
 
     def get_action(self, params: MPPIParams, t: float) -> jax.Array:
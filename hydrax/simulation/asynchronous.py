@@ -121,14 +121,16 @@ def run_controller(
         f"over a {ctrl.task.planning_horizon * ctrl.task.dt} second horizon."
     )
 
-    # Jit the optimizer step, then signal that we're ready to go
+    # Compile the optimizer step and action lookup ahead of time, then signal
+    # that we're ready to go
     print("Jitting controller...")
     st = time.time()
-    jit_optimize = jax.jit(
-        lambda d, p: ctrl.optimize(d, p)[0], donate_argnums=(1,)
+    jit_optimize = (
+        jax.jit(lambda d, p: ctrl.optimize(d, p)[0], donate_argnums=(1,))
+        .lower(mjx_data, policy_params)
+        .compile()
     )
-    get_action = jax.jit(ctrl.get_action)
-    policy_params = jit_optimize(mjx_data, policy_params)
+    get_action = jax.jit(ctrl.get_action).lower(policy_params, 0.0).compile()
     print(f"Time to jit: {time.time() - st}")
 
     # Signal that we're ready to start
@@ -74,13 +74,28 @@ def run_interactive(
         mocap_pos=mj_data.mocap_pos, mocap_quat=mj_data.mocap_quat
     )
     policy_params = controller.init_params()
-    jit_optimize = jax.jit(controller.optimize, donate_argnums=(1,))
 
-    # Warm-up the controller
+    # Compile the controller ahead of time, so that the first replanning step
+    # in the simulation loop doesn't stall on tracing and compilation.
     print("Jitting the controller...")
     st = time.time()
-    policy_params, rollouts = jit_optimize(mjx_data, policy_params)
+    jit_optimize = (
+        jax.jit(controller.optimize, donate_argnums=(1,))
+        .lower(mjx_data, policy_params)
+        .compile()
+    )
+
+    # All the actions we'll apply between replanning steps are computed at once
+    action_times = jnp.array(
+        np.arange(sim_steps_per_replan) * mj_model.opt.timestep
+    )
+    get_actions = (
+        jax.jit(jax.vmap(controller.get_action, in_axes=(None, 0)))
+        .lower(policy_params, action_times)
+        .compile()
+    )
     print(f"Time to jit: {time.time() - st:.3f} seconds")
+    _, rollouts = jit_optimize.out_info  # shapes only, nothing is run yet
     num_traces = min(rollouts.controls.shape[1], max_traces)
 
     # Start the simulation
@@ -120,6 +135,13 @@ def run_interactive(
             # Do a replanning step
             plan_start = time.time()
             policy_params, rollouts = jit_optimize(mjx_data, policy_params)
+
+            # Copy the actions for this replanning period, plus the few rollout
+            # traces that we actually draw, to the host in one go. This is the
+            # only place we wait for the device in each iteration.
+            actions = get_actions(policy_params, action_times)
+            traces = rollouts.trace_sites[:num_traces] if show_traces else None
+            actions, trace_sites = jax.device_get((actions, traces))
             plan_time = time.time() - plan_start
 
             # Visualize the rollouts
@@ -132,16 +154,14 @@ def run_interactive(
                                 viewer.user_scn.geoms[ii],
                                 mujoco.mjtGeom.mjGEOM_LINE,
                                 trace_width,
-                                rollouts.trace_sites[i, j, k],
-                                rollouts.trace_sites[i, j + 1, k],
+                                trace_sites[i, j, k],
+                                trace_sites[i, j + 1, k],
                             )
                             ii += 1
 
             # Step the simulation
             for i in range(sim_steps_per_replan):
-                t = i * mj_model.opt.timestep
-                u = controller.get_action(policy_params, t)
-                mj_data.ctrl[:] = np.array(u)
+                mj_data.ctrl[:] = actions[i]
                 mujoco.mj_step(mj_model, mj_data)
                 viewer.sync()
 
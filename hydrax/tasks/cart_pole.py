@@ -27,21 +27,20 @@ class CartPole(Task):
 
     def _distance_to_upright(self, state: mjx.Data) -> jax.Array:
         """Get a measure of distance to the upright position."""
-        theta = state.qpos[1] + jnp.pi
-        theta_err = jnp.array([jnp.cos(theta) - 1, jnp.sin(theta)])
-        return jnp.sum(jnp.square(theta_err))
+        # With θ = q + π, ‖[cos θ - 1, sin θ]‖² = 4 sin²(θ/2) = 4 cos²(q/2)
+        return 4.0 * jnp.square(jnp.cos(state.qpos[1] / 2))
 
     def running_cost(self, state: mjx.Data, control: jax.Array) -> jax.Array:
         """The running cost ℓ(xₜ, uₜ)."""
         theta_cost = self._distance_to_upright(state)
-        centering_cost = jnp.sum(jnp.square(state.qpos[0]))
-        velocity_cost = 0.01 * jnp.sum(jnp.square(state.qvel))
-        control_cost = 0.01 * jnp.sum(jnp.square(control))
+        centering_cost = jnp.square(state.qpos[0])
+        velocity_cost = 0.01 * jnp.dot(state.qvel, state.qvel)
+        control_cost = 0.01 * jnp.dot(control, control)
         return theta_cost + centering_cost + velocity_cost + control_cost
 
     def terminal_cost(self, state: mjx.Data) -> jax.Array:
         """The terminal cost ϕ(x_T)."""
         theta_cost = 10 * self._distance_to_upright(state)
-        centering_cost = jnp.sum(jnp.square(state.qpos[0]))
-        velocity_cost = 0.01 * jnp.sum(jnp.square(state.qvel))
+        centering_cost = jnp.square(state.qpos[0])
+        velocity_cost = 0.01 * jnp.dot(state.qvel, state.qvel)
         return theta_cost + centering_cost + velocity_cost
@@ -29,21 +29,20 @@ class DoubleCartPole(Task):
 
     def _distance_to_upright(self, state: mjx.Data) -> jax.Array:
         """Get a measure of distance to the upright position."""
-        tip_z = state.site_xpos[self.tip_id, 2]
-        tip_x = state.site_xpos[self.tip_id, 0]
+        tip_pos = state.site_xpos[self.tip_id]  # single gather for x and z
         cart_x = state.qpos[0]
-        return jnp.square(tip_z - 4.0) + jnp.square(tip_x - cart_x)
+        return jnp.square(tip_pos[2] - 4.0) + jnp.square(tip_pos[0] - cart_x)
 
     def running_cost(self, state: mjx.Data, control: jax.Array) -> jax.Array:
         """The running cost ℓ(xₜ, uₜ)."""
         upright_cost = self._distance_to_upright(state)
-        velocity_cost = 0.1 * jnp.sum(jnp.square(state.qvel[1:]))
-        control_cost = 0.001 * jnp.sum(jnp.square(control))
+        velocity_cost = 0.1 * jnp.dot(state.qvel[1:], state.qvel[1:])
+        control_cost = 0.001 * jnp.dot(control, control)
         return upright_cost + velocity_cost + control_cost
 
     def terminal_cost(self, state: mjx.Data) -> jax.Array:
         """The terminal cost ϕ(x_T)."""
         upright_cost = 10 * self._distance_to_upright(state)
         centering_cost = 10 * jnp.square(state.qpos[0])
-        velocity_cost = jnp.sum(jnp.square(state.qvel))
+        velocity_cost = jnp.dot(state.qvel, state.qvel)
         return upright_cost + centering_cost + velocity_cost
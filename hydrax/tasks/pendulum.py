@@ -28,8 +28,8 @@ class Pendulum(Task):
     def _distance_to_upright(self, state: mjx.Data) -> jax.Array:
         """Get a measure of distance to the upright position."""
         theta = state.qpos[0] - jnp.pi
-        theta_err = jnp.array([jnp.cos(theta) - 1, jnp.sin(theta)])
-        return jnp.sum(jnp.square(theta_err))
+        # ‖[cos θ - 1, sin θ]‖² = 4 sin²(θ/2)
+        return 4.0 * jnp.square(jnp.sin(theta / 2))
 
     def running_cost(self, state: mjx.Data, control: jax.Array) -> jax.Array:
         """The running cost ℓ(xₜ, uₜ)."""
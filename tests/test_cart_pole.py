@@ -12,6 +12,16 @@ def test_cart_pole() -> None:
     state = mjx.make_data(task.model)
     assert isinstance(state, mjx.Data)
 
+    # Hanging straight down is as far as we can be from upright
+    assert jnp.allclose(task._distance_to_upright(state), 4.0)
+    upright = state.replace(qpos=jnp.array([0.0, jnp.pi]))
+    assert jnp.allclose(task._distance_to_upright(upright), 0.0, atol=1e-6)
+
+    nearly_upright = state.replace(qpos=jnp.array([0.0, jnp.pi + 1e-3]))
+    assert jnp.allclose(
+        task._distance_to_upright(nearly_upright), 1e-6, rtol=1e-3
+    )
+
     ell = task.running_cost(state, jnp.zeros(1))
     assert ell.shape == ()
 
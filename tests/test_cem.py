@@ -14,7 +14,7 @@ def test_open_loop() -> None:
     opt = CEM(
         task, num_samples=32, num_elites=4, sigma_start=1.0, sigma_min=0.1
     )
-    jit_opt = jax.jit(opt.optimize)
+    jit_opt = jax.jit(opt.optimize, donate_argnums=(1,))
 
     # Initialize the system state and policy parameters
     state = mjx.make_data(task.model)
@@ -39,7 +39,7 @@ def test_open_loop() -> None:
     # Task and optimizer setup
     task = Pendulum()
     opt = Evosax(task, evosax.CMA_ES, num_samples=32, elite_ratio=0.1)
-    jit_opt = jax.jit(opt.optimize)
+    jit_opt = jax.jit(opt.optimize, donate_argnums=(1,))
 
     # Initialize the system state and policy parameters
     state = mjx.make_data(task.model)
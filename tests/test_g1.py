@@ -1,5 +1,5 @@
 import time
-from typing import Tuple
+from typing import Callable, Tuple
 
 import jax
 import jax.numpy as jnp
@@ -10,6 +10,41 @@ from hydrax import ROOT
 from hydrax.tasks.humanoid import Humanoid
 
 
+def _make_rollout(
+    model: mjx.Model, nu: int, num_steps: int
+) -> Callable[[mjx.Data, jax.Array], Tuple[mjx.Data, jax.Array]]:
+    """Make a function that steps the dynamics forward with random inputs.
+
+    Args:
+        model: The MJX model to simulate.
+        nu: The number of control inputs.
+        num_steps: The number of simulation steps to take.
+
+    Returns:
+        A function mapping (data, rng) to the updated (data, rng).
+    """
+
+    def step(data: mjx.Data, rng: jax.Array) -> Tuple[mjx.Data, jax.Array]:
+        """Do a single step of the forward dynamics with a random input."""
+        rng, sample_rng = jax.random.split(rng)
+        u = jax.random.uniform(sample_rng, (nu,), minval=-1.0, maxval=1.0)
+        data = data.replace(ctrl=u)
+        return mjx.step(model, data), rng
+
+    def rollout(data: mjx.Data, rng: jax.Array) -> Tuple[mjx.Data, jax.Array]:
+        """Do all of the steps in a single scan."""
+
+        def _scan_fn(carry: Tuple[mjx.Data, jax.Array], _: None):
+            return step(*carry), None
+
+        (data, rng), _ = jax.lax.scan(
+            _scan_fn, (data, rng), None, length=num_steps
+        )
+        return data, rng
+
+    return rollout
+
+
 def test_mjx_model() -> None:
     """Test that the MJX model runs without crashing."""
     rng = jax.random.key(0)
@@ -18,36 +53,70 @@ def test_mjx_model() -> None:
     model = mjx.put_model(mj_model)
     data = mjx.make_data(model)
 
+    # Use host-side model constants, not the device arrays in `model`
     nu = mj_model.nu
-    assert mj_model.nu + 6 == mj_model.nv
+    dt = mj_model.opt.timestep
+    assert nu + 6 == mj_model.nv
 
     assert isinstance(model, mjx.Model)
     assert isinstance(data, mjx.Data)
 
-    @jax.jit
-    def step(data: mjx.Data, rng: jax.Array) -> Tuple[mjx.Data, jax.Array]:
-        """Do a single step of the forward dyanmics with a random input."""
-        rng, sample_rng = jax.random.split(rng)
-        u = jax.random.uniform(sample_rng, (nu,), minval=-1.0, maxval=1.0)
-        data = data.replace(ctrl=u)
-        return mjx.step(model, data), rng
-
+    # Compile without running, so the jit time doesn't include any steps
     st = time.time()
-    data, rng = step(data, rng)
+    rollout = jax.jit(_make_rollout(model, nu, 100))
+    rollout = rollout.lower(data, rng).compile()
     print(f"Time to jit: {time.time() - st:.3f}s")
 
     st = time.time()
-    for _ in range(100):
-        data, rng = step(data, rng)
+    data, rng = jax.block_until_ready(rollout(data, rng))
     run_time = time.time() - st
     print(f"Time to run 100 steps: {run_time:.3f}s")
-    sim_time = model.opt.timestep * 100
+    sim_time = dt * 100
     print(f"Realtime rate: {sim_time / run_time:.3f}x")
 
     assert not jnp.any(jnp.isnan(data.qpos))
     assert not jnp.any(jnp.isnan(data.qvel))
 
 
+def test_mjx_model_batched() -> None:
+    """Measure the throughput of many G1 simulations running in parallel."""
+    num_envs = 64
+    num_steps = 10
+    rng = jax.random.key(0)
+
+    mj_model = mujoco.MjModel.from_xml_path(ROOT + "/models/g1/scene.xml")
+    model = mjx.put_model(mj_model)
+    nq = mj_model.nq
+    nu = mj_model.nu
+    dt = mj_model.opt.timestep
+
+    # Each environment starts from a slightly different configuration
+    rng, init_rng = jax.random.split(rng)
+    data = jax.vmap(
+        lambda rng: mjx.make_data(model).replace(
+            qpos=model.qpos0 + 0.01 * jax.random.normal(rng, (nq,))
+        )
+    )(jax.random.split(init_rng, num_envs))
+    rngs = jax.random.split(rng, num_envs)
+    assert data.qpos.shape == (num_envs, nq)
+
+    # Compile without running, so the jit time doesn't include any steps
+    st = time.time()
+    rollout = jax.jit(jax.vmap(_make_rollout(model, nu, num_steps)))
+    rollout = rollout.lower(data, rngs).compile()
+    print(f"Time to jit: {time.time() - st:.3f}s")
+
+    st = time.time()
+    data, rngs = jax.block_until_ready(rollout(data, rngs))
+    run_time = time.time() - st
+    print(f"Time to run {num_steps} steps of {num_envs} envs: {run_time:.3f}s")
+    sim_time = dt * num_steps * num_envs
+    print(f"Amortized realtime rate: {sim_time / run_time:.3f}x")
+
+    assert not jnp.any(jnp.isnan(data.qpos))
+    assert not jnp.any(jnp.isnan(data.qvel))
+
+
 def test_task() -> None:
     """Test the humanoid task."""
     task = Humanoid()
@@ -75,4 +144,5 @@ def test_task() -> None:
 
 if __name__ == "__main__":
     test_mjx_model()
+    test_mjx_model_batched()
     test_task()
@@ -1,8 +1,10 @@
 import jax
 import jax.numpy as jnp
 import matplotlib.pyplot as plt
+import pytest
 from mujoco import mjx
 
+from hydrax.alg_base import Trajectory
 from hydrax.algs.mppi import MPPI
 from hydrax.tasks.pendulum import Pendulum
 
@@ -12,7 +14,7 @@ def test_open_loop() -> None:
     # Task and optimizer setup
     task = Pendulum()
     opt = MPPI(task, num_samples=32, noise_level=0.1, temperature=0.01)
-    jit_opt = jax.jit(opt.optimize)
+    jit_opt = jax.jit(opt.optimize, donate_argnums=(1,))
 
     # Initialize the system state and policy parameters
     state = mjx.make_data(task.model)
@@ -55,5 +57,72 @@ def test_open_loop() -> None:
         plt.show()
 
 
+def test_elites() -> None:
+    """Check that only the elite samples contribute to the MPPI update."""
+    task = Pendulum()
+    opt = MPPI(
+        task, num_samples=4, noise_level=0.1, temperature=1e6, num_elites=2
+    )
+    params = opt.init_params()
+
+    # Four constant control sequences, where the middle two are cheapest
+    horizon = task.planning_horizon
+    u = jnp.array([1.0, 2.0, 3.0, 10.0])
+    J = jnp.array([3.0, 1.0, 2.0, 4.0])
+    controls = jnp.broadcast_to(u[:, None, None], (4, horizon, 1))
+    rollouts = Trajectory(
+        controls=controls,
+        costs=jnp.broadcast_to(J[:, None], (4, horizon + 1)),
+        trace_sites=jnp.zeros((4, horizon + 1, 0, 3)),
+    )
+
+    # With a high temperature, the new mean is the average of the elites,
+    # rather than the average of all the samples (4.0)
+    mean = opt.update_params(params, rollouts).mean
+    assert jnp.allclose(mean, 2.5)
+
+    # The non-elite samples have no effect, however extreme they are
+    outliers = controls.at[jnp.array([0, 3])].set(1e3)
+    rollouts = rollouts.replace(controls=outliers)
+    assert jnp.allclose(opt.update_params(params, rollouts).mean, mean)
+
+    # We can't keep more elites than there are samples
+    with pytest.raises(AssertionError):
+        MPPI(
+            task, num_samples=4, noise_level=0.1, temperature=1.0, num_elites=5
+        )
+
+
+def test_parallel_controllers() -> None:
+    """Run several independently seeded MPPI controllers in parallel."""
+    task = Pendulum()
+    opt = MPPI(task, num_samples=32, noise_level=0.1, temperature=0.01)
+    num_controllers = 4
+
+    # Stack the parameters of each controller along a new leading axis, and
+    # vmap the optimizer over them so that a single compile serves them all.
+    params = jax.tree.map(
+        lambda *xs: jnp.stack(xs),
+        *[opt.init_params(seed) for seed in range(num_controllers)],
+    )
+    jit_opt = jax.jit(
+        jax.vmap(opt.optimize, in_axes=(None, 0)), donate_argnums=(1,)
+    )
+
+    state = mjx.make_data(task.model)
+    for _ in range(100):
+        params, _ = jit_opt(state, params)
+    assert params.mean.shape == (num_controllers, task.planning_horizon, 1)
+    assert not jnp.allclose(params.mean[0], params.mean[1])
+
+    # Roll out each controller's solution and pick the best one
+    _, rollouts = jax.jit(opt.eval_rollouts)(task.model, state, params.mean)
+    total_costs = jnp.sum(rollouts.costs, axis=1)
+    best_idx = jnp.argmin(total_costs)
+    assert total_costs[best_idx] <= 9.0
+
+
 if __name__ == "__main__":
     test_open_loop()
+    test_elites()
+    test_parallel_controllers()
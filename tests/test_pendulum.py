@@ -12,6 +12,11 @@ def test_pendulum() -> None:
     state = mjx.make_data(task.model)
     assert isinstance(state, mjx.Data)
 
+    nearly_upright = state.replace(qpos=jnp.array([jnp.pi + 1e-3]))
+    assert jnp.allclose(
+        task._distance_to_upright(nearly_upright), 1e-6, rtol=1e-3
+    )
+
     ell = task.running_cost(state, jnp.zeros(1))
     assert ell.shape == ()
 